@@ -10,16 +10,28 @@ Usage:
 """
 
 import argparse
+import asyncio
+import http.client
 import json
 import os
+import queue
 import re
+import sqlite3
 import subprocess
 import sys
-import time
-from dataclasses import dataclass, field, asdict
+import zlib
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, fields, is_dataclass, asdict
 from datetime import datetime, timezone, timedelta
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+from urllib.parse import quote, urlsplit
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used when it isn't installed
+    orjson = None
 
 
 # ============================================================================
@@ -28,6 +40,8 @@ from typing import Optional
 
 CONFIG_FILE = Path(__file__).parent / "org_config.json"
 OUTPUT_FILE = Path(__file__).parent / "data" / "org_data.json"
+CACHE_FILE = OUTPUT_FILE.parent / "cache.sqlite"
+CACHE_ENTRY_MAX_AGE = 7 * 24 * 3600  # Drop ETag / compare entries unused this long
 
 DEFAULT_CONFIG = {
     "organization": "BreadchainCoop",
@@ -38,6 +52,7 @@ DEFAULT_CONFIG = {
     "ci_cache_pending_seconds": 300,
     "ci_cache_stable_seconds": 900,
     "refresh_interval_minutes": 15,
+    "max_concurrency": 8,
     "repo_filters": {
         "exclude": [],
         "include_archived": False,
@@ -64,28 +79,76 @@ def load_config() -> dict:
     return config
 
 
+def json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, with orjson when it's installed."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode obj as compact JSON bytes, with orjson when it's installed."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def dataclass_to_dict(obj: Any) -> dict:
+    """json.dump default hook: encode a dataclass as its fields, in declaration order."""
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(path: Path, data: dict) -> None:
+    """Write data (which may contain dataclasses) as indented JSON.
+
+    orjson serializes dataclasses natively; the stdlib fallback expands them
+    through dataclass_to_dict.
+    """
+    if orjson:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, default=dataclass_to_dict)
+
+
 def utc_now() -> datetime:
     """Get current time in UTC."""
     return datetime.now(timezone.utc)
 
 
+def parse_gh_timestamp(value: Optional[str]) -> int:
+    """Parse a GitHub ISO-8601 timestamp to a unix timestamp (0 if missing)."""
+    if not value:
+        return 0
+    return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+
+
+def format_gh_timestamp(ts: int) -> Optional[str]:
+    """Format a unix timestamp the way GitHub does (None if missing)."""
+    if not ts:
+        return None
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RepoInfo:
     name: str
     full_name: str
     default_branch: str
     html_url: str
-    pushed_at: str
+    pushed_at: int  # unix timestamp, 0 if the repo was never pushed
     updated_at: str
     description: Optional[str] = None
     is_archived: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PRInfo:
     number: int
     title: str
@@ -96,13 +159,15 @@ class PRInfo:
     updated_at: str
     html_url: str
     ci_status: str = ""
+    head_sha: str = ""
+    base_sha: str = ""
     state: str = "open"
     labels: list = field(default_factory=list)
     draft: bool = False
     mergeable: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueInfo:
     number: int
     title: str
@@ -116,7 +181,7 @@ class IssueInfo:
     comments: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitInfo:
     sha: str
     short_sha: str
@@ -126,7 +191,7 @@ class CommitInfo:
     html_url: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TreeNode:
     name: str
     branch: str
@@ -137,18 +202,141 @@ class TreeNode:
     pr_author: Optional[str] = None
     last_updated: Optional[str] = None
     ci_status: str = ""
-    children: list = field(default_factory=list)
-    commits_from_parent: list = field(default_factory=list)
-    parent_branch_name: Optional[str] = None
     github_url: str = ""
     is_draft: bool = False
     labels: list = field(default_factory=list)
+    commits_from_parent: list = field(default_factory=list)
+    parent_branch_name: Optional[str] = None
+    children: list = field(default_factory=list)
+
+
+# ============================================================================
+# Persistent Cache
+# ============================================================================
+
+def get_ci_cache_duration(status: str, config: dict) -> int:
+    """Get cache duration based on CI status."""
+    if status == "pending":
+        return config.get("ci_cache_pending_seconds", 300)
+    elif status in ("pass", "fail"):
+        return config.get("ci_cache_stable_seconds", 900)
+    return 0
+
+
+class ApiCache:
+    """SQLite store for API results that can be reused across runs.
+
+    Writes accumulate in one transaction that is committed on close().
+    """
+
+    def __init__(self, path: Path):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS ci_status (
+                repo TEXT,
+                sha TEXT,
+                status TEXT,
+                ts INTEGER,
+                PRIMARY KEY (repo, sha)
+            );
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                link TEXT,
+                body BLOB,
+                ts INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS compare_cache (
+                repo TEXT,
+                base_sha TEXT,
+                head_sha TEXT,
+                commits BLOB,
+                ts INTEGER,
+                PRIMARY KEY (repo, base_sha, head_sha)
+            );
+        """)
+
+    def get_ci_statuses(self, repo: str, config: dict, now: int) -> dict[str, str]:
+        """Return head_sha -> CI status for a repo's entries that are still fresh."""
+        rows = self.conn.execute(
+            "SELECT sha, status, ts FROM ci_status WHERE repo = ?", (repo,)
+        )
+        return {
+            sha: status
+            for sha, status, ts in rows
+            if now - ts < get_ci_cache_duration(status, config)
+        }
+
+    def put_ci_statuses(self, repo: str, statuses: dict[str, str], now: int) -> None:
+        """Record freshly fetched head_sha -> CI status entries for a repo."""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO ci_status (repo, sha, status, ts) VALUES (?, ?, ?, ?)",
+            [(repo, sha, status, now) for sha, status in statuses.items() if sha],
+        )
+
+    def get_http(self, url: str) -> Optional[tuple[str, str, bytes]]:
+        """Return (etag, link header, body) last seen for a URL."""
+        row = self.conn.execute(
+            "SELECT etag, link, body FROM http_cache WHERE url = ?", (url,)
+        ).fetchone()
+        if not row:
+            return None
+        etag, link, body = row
+        return etag, link, zlib.decompress(body)
+
+    def put_http(self, url: str, etag: str, link: str, body: bytes, now: int) -> None:
+        """Remember a response body under its ETag."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO http_cache (url, etag, link, body, ts) VALUES (?, ?, ?, ?, ?)",
+            (url, etag, link, zlib.compress(body), now),
+        )
+
+    def touch_http(self, url: str, now: int) -> None:
+        """Mark a cached response as still in use."""
+        self.conn.execute("UPDATE http_cache SET ts = ? WHERE url = ?", (now, url))
+
+    def get_commits(self, repo: str, base_sha: str, head_sha: str, now: int) -> Optional[list[dict]]:
+        """Return the commit list stored for a base...head pair, if any."""
+        row = self.conn.execute(
+            "SELECT commits FROM compare_cache WHERE repo = ? AND base_sha = ? AND head_sha = ?",
+            (repo, base_sha, head_sha),
+        ).fetchone()
+        if not row:
+            return None
+        self.conn.execute(
+            "UPDATE compare_cache SET ts = ? WHERE repo = ? AND base_sha = ? AND head_sha = ?",
+            (now, repo, base_sha, head_sha),
+        )
+        return json_loads(zlib.decompress(row[0]))
+
+    def put_commits(self, repo: str, base_sha: str, head_sha: str, commits: list[dict], now: int) -> None:
+        """Store the commit list for a base...head pair; it never changes for fixed SHAs."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO compare_cache (repo, base_sha, head_sha, commits, ts) VALUES (?, ?, ?, ?, ?)",
+            (repo, base_sha, head_sha, zlib.compress(json_dumps(commits)), now),
+        )
+
+    def prune(self, max_age: int, now: int) -> None:
+        """Drop entries too old to ever be reused."""
+        self.conn.execute("DELETE FROM ci_status WHERE ts < ?", (now - max_age,))
+        self.conn.execute("DELETE FROM http_cache WHERE ts < ?", (now - CACHE_ENTRY_MAX_AGE,))
+        self.conn.execute("DELETE FROM compare_cache WHERE ts < ?", (now - CACHE_ENTRY_MAX_AGE,))
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
 
 
 # ============================================================================
 # GitHub API Functions
 # ============================================================================
 
+GITHUB_API_HOST = "api.github.com"
+
+# Matches the rel="next" entry of a GitHub Link pagination header
+LINK_NEXT_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+
 def run_gh_command(args: list, timeout: int = 30) -> Optional[str]:
     """Run a gh CLI command and return stdout."""
     try:
@@ -159,9 +347,6 @@ def run_gh_command(args: list, timeout: int = 30) -> Optional[str]:
             timeout=timeout,
         )
         if result.returncode != 0:
-            if "--json" in args:
-                # API calls may fail for permissions or rate limits
-                return None
             return None
         return result.stdout
     except (subprocess.TimeoutExpired, FileNotFoundError) as e:
@@ -169,62 +354,220 @@ def run_gh_command(args: list, timeout: int = 30) -> Optional[str]:
         return None
 
 
-def get_org_repos(org: str, config: dict) -> list[RepoInfo]:
-    """Fetch all repositories for an organization."""
-    print(f"Fetching repositories for {org}...")
+class GitHubClient:
+    """Minimal GitHub API client that reuses keep-alive HTTPS connections.
+
+    Requests run in worker threads so they don't block the event loop; a
+    semaphore bounds how many are in flight, and idle connections are
+    pooled so each one pays the TCP + TLS handshake only once per run.
+    GET responses are revalidated with If-None-Match against the cache, so
+    unchanged resources come back as 304s that don't count against the
+    rate limit.
+    """
+
+    def __init__(self, token: str, cache: ApiCache, now: int, max_connections: int = 8, timeout: int = 30):
+        self.cache = cache
+        self.now = now  # run start, used to stamp every cache write
+        self.timeout = timeout
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "org-activity-tracker",
+        }
+        self._semaphore = asyncio.Semaphore(max_connections)
+        self._idle: queue.SimpleQueue[http.client.HTTPSConnection] = queue.SimpleQueue()
+
+    def _send(self, method: str, path: str, body: Optional[bytes], extra_headers: dict) -> tuple[int, http.client.HTTPMessage, bytes]:
+        headers = {**self.headers, **extra_headers}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
 
-    output = run_gh_command([
-        "api", f"orgs/{org}/repos",
-        "--paginate",
-        "--jq", '.[] | {name, full_name, default_branch, html_url, pushed_at, updated_at, description, archived}'
-    ])
+        try:
+            conn = self._idle.get_nowait()
+            reused = True
+        except queue.Empty:
+            conn = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=self.timeout)
+            reused = False
+
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            if not reused:
+                raise
+            # The server may have dropped an idle keep-alive connection; retry once on a fresh one
+            conn = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=self.timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._idle.put(conn)
+        return response.status, response.headers, data
+
+    async def request(
+        self, method: str, path: str, body: Optional[bytes] = None, use_cache: bool = True
+    ) -> Optional[tuple[str, bytes]]:
+        """Send a request and return (Link header, body), or None on failure.
+
+        Pass use_cache=False for responses that are cached elsewhere, so they
+        aren't also stored (and revalidated) in the HTTP cache.
+        """
+        use_cache = use_cache and method == "GET"
+        cached = self.cache.get_http(path) if use_cache else None
+        extra_headers = {"If-None-Match": cached[0]} if cached else {}
+
+        async with self._semaphore:
+            try:
+                status, headers, data = await asyncio.to_thread(self._send, method, path, body, extra_headers)
+            except (http.client.HTTPException, OSError) as e:
+                print(f"Error requesting {path}: {e}", file=sys.stderr)
+                return None
+
+        if status == 304 and cached:
+            self.cache.touch_http(path, self.now)
+            return cached[1], cached[2]
+        if status >= 400:
+            # API calls may fail for permissions or rate limits
+            return None
+
+        link = headers.get("Link", "")
+        if use_cache and headers.get("ETag"):
+            self.cache.put_http(path, headers["ETag"], link, data, self.now)
+        return link, data
+
+    async def get_json(self, path: str, use_cache: bool = True) -> Any:
+        """GET a REST endpoint and decode the JSON response."""
+        response = await self.request("GET", path, use_cache=use_cache)
+        if not response:
+            return None
+        try:
+            return json_loads(response[1])
+        except json.JSONDecodeError:
+            return None
+
+    async def iter_pages(self, path: str) -> AsyncIterator[list]:
+        """Yield each page of a list endpoint, following Link rel="next" headers.
+
+        The next page is requested before the current one is handed back, so
+        the caller's parsing and filtering overlap with the next round-trip.
+        """
+        pending: Optional[asyncio.Future] = asyncio.ensure_future(self.request("GET", path))
+        try:
+            while pending:
+                response = await pending
+                pending = None
+                if not response:
+                    return
+                link, data = response
+                match = LINK_NEXT_RE.search(link)
+                if match:
+                    url = urlsplit(match.group(1))
+                    pending = asyncio.ensure_future(self.request("GET", f"{url.path}?{url.query}"))
+                try:
+                    page = json_loads(data)
+                except json.JSONDecodeError:
+                    return
+                yield page
+        finally:
+            if pending:
+                pending.cancel()
+
+    async def get_paginated(self, path: str) -> Optional[list]:
+        """GET every page of a list endpoint into one list."""
+        items = [item async for page in self.iter_pages(path) for item in page]
+        return items or None
+
+    async def graphql(self, query: str, variables: dict) -> Optional[dict]:
+        """Run a GraphQL query and return its data object."""
+        body = json_dumps({"query": query, "variables": variables})
+        response = await self.request("POST", "/graphql", body)
+        if not response:
+            return None
+        try:
+            return json_loads(response[1]).get("data")
+        except (json.JSONDecodeError, AttributeError):
+            return None
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def get_auth_token() -> Optional[str]:
+    """Get an API token from GH_TOKEN / GITHUB_TOKEN, else from the gh login."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    output = run_gh_command(["auth", "token"])
+    return output.strip() if output else None
+
+
+# Fields read from every REST repo object, in RepoInfo field order
+get_repo_fields = itemgetter(
+    "name", "full_name", "default_branch", "html_url",
+    "pushed_at", "updated_at", "description", "archived",
+)
 
-    if not output:
-        print(f"Failed to fetch repos for {org}", file=sys.stderr)
-        return []
+
+async def get_org_repos(client: GitHubClient, org: str, config: dict, run_start: datetime) -> list[RepoInfo]:
+    """Fetch all repositories for an organization."""
+    print(f"Fetching repositories for {org}...")
 
     repos = []
     filters = config.get("repo_filters", {})
-    exclude_list = filters.get("exclude", [])
+    exclude_list = set(filters.get("exclude", []))
     include_archived = filters.get("include_archived", False)
     min_pushed_days = filters.get("min_pushed_days_ago", 365)
     max_repos = config.get("max_repos", 50)
 
-    cutoff_date = utc_now() - timedelta(days=min_pushed_days)
+    # GitHub timestamps are fixed-width UTC ISO-8601 strings, so they compare
+    # lexicographically; format the cutoff the same way instead of parsing each one
+    cutoff_iso = (run_start - timedelta(days=min_pushed_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    for line in output.strip().split('\n'):
-        if not line:
-            continue
-        try:
-            data = json.loads(line)
+    # Filter each page as it arrives instead of buffering the whole listing
+    seen = 0
+    async for page in client.iter_pages(f"/orgs/{quote(org)}/repos?per_page=100"):
+        seen += len(page)
+        for data in page:
+            (name, full_name, default_branch, html_url,
+             pushed_at, updated_at, description, archived) = get_repo_fields(data)
 
             # Apply filters
-            if data["name"] in exclude_list:
+            if name in exclude_list:
                 continue
-            if data.get("archived", False) and not include_archived:
+            if archived and not include_archived:
                 continue
 
             # Check pushed_at date
-            if data.get("pushed_at"):
-                pushed_at = datetime.fromisoformat(data["pushed_at"].replace("Z", "+00:00"))
-                if pushed_at < cutoff_date:
-                    continue
+            if pushed_at and pushed_at < cutoff_iso:
+                continue
 
+            # Only repos that are kept get their pushed_at parsed, for the sort below
             repos.append(RepoInfo(
-                name=data["name"],
-                full_name=data["full_name"],
-                default_branch=data.get("default_branch", "main"),
-                html_url=data["html_url"],
-                pushed_at=data.get("pushed_at", ""),
-                updated_at=data.get("updated_at", ""),
-                description=data.get("description"),
-                is_archived=data.get("archived", False),
+                name, full_name, default_branch, html_url,
+                parse_gh_timestamp(pushed_at), updated_at, description, archived,
             ))
-        except json.JSONDecodeError:
-            continue
+
+    if not seen:
+        print(f"Failed to fetch repos for {org}", file=sys.stderr)
+        return []
 
     # Sort by pushed_at descending (most recently active first)
-    repos.sort(key=lambda r: r.pushed_at or "", reverse=True)
+    repos.sort(key=attrgetter("pushed_at"), reverse=True)
 
     # Limit number of repos
     if len(repos) > max_repos:
@@ -235,155 +578,399 @@ def get_org_repos(org: str, config: dict) -> list[RepoInfo]:
     return repos
 
 
-def get_repo_prs(repo_full_name: str) -> list[PRInfo]:
-    """Fetch open PRs for a repository."""
-    output = run_gh_command([
-        "pr", "list",
-        "--repo", repo_full_name,
-        "--state", "open",
-        "--json", "number,title,headRefName,baseRefName,author,createdAt,updatedAt,url,state,labels,isDraft,mergeable"
-    ])
+PR_FIELDS_FRAGMENT = """
+fragment PRFields on PullRequest {
+  number title headRefName headRefOid baseRefName baseRefOid createdAt updatedAt url state isDraft mergeable
+  author { login }
+  labels(first: 100) { nodes { name } }
+  commits(last: 1) @include(if: $ci) {
+    nodes { commit { statusCheckRollup { state } } }
+  }
+}
+"""
 
-    if not output:
-        return []
+ISSUE_FIELDS_FRAGMENT = """
+fragment IssueFields on Issue {
+  number title createdAt updatedAt url state
+  author { login }
+  labels(first: 100) { nodes { name } }
+  assignees(first: 100) { nodes { login } }
+  comments { totalCount }
+}
+"""
 
-    try:
-        prs_data = json.loads(output)
-        prs = []
-        for pr in prs_data:
-            labels = [l.get("name", "") for l in pr.get("labels", [])]
-            prs.append(PRInfo(
-                number=pr["number"],
-                title=pr["title"],
-                head_branch=pr["headRefName"],
-                base_branch=pr["baseRefName"],
-                author=pr.get("author", {}).get("login", "unknown"),
-                created_at=pr.get("createdAt", ""),
-                updated_at=pr.get("updatedAt", ""),
-                html_url=pr.get("url", ""),
-                state=pr.get("state", "open"),
-                labels=labels,
-                draft=pr.get("isDraft", False),
-                mergeable=pr.get("mergeable") != "CONFLICTING",
-            ))
-        return prs
-    except json.JSONDecodeError:
-        return []
+ORG_SEARCH_QUERY = """
+query($q: String!, $ci: Boolean!, $endCursor: String) {
+  search(query: $q, type: ISSUE, first: 100, after: $endCursor) {
+    issueCount
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest {
+        repository { nameWithOwner }
+        ...PRFields
+      }
+      ... on Issue {
+        repository { nameWithOwner }
+        ...IssueFields
+      }
+    }
+  }
+}
+""" + PR_FIELDS_FRAGMENT + ISSUE_FIELDS_FRAGMENT
+
+REPO_PRS_QUERY = """
+query($owner: String!, $name: String!, $ci: Boolean!, $endCursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: OPEN, first: 100, after: $endCursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { ...PRFields }
+    }
+  }
+}
+""" + PR_FIELDS_FRAGMENT
+
+# GitHub search never returns more than this many results for one query
+SEARCH_RESULT_LIMIT = 1000
+
+# Fields read from every PRFields node
+get_pr_fields = itemgetter(
+    "number", "title", "headRefName", "baseRefName", "createdAt", "updatedAt",
+    "url", "state", "isDraft", "mergeable", "headRefOid", "baseRefOid",
+)
+
+# Fields read from every IssueFields node, in IssueInfo field order
+get_issue_fields = itemgetter("number", "title", "author", "createdAt", "updatedAt", "url", "state")
+
+# statusCheckRollup.state -> the pass/pending/fail buckets used by the frontend
+CI_ROLLUP_STATES = {
+    "SUCCESS": "pass",
+    "PENDING": "pending",
+    "EXPECTED": "pending",
+    "FAILURE": "fail",
+    "ERROR": "fail",
+}
 
 
-def get_repo_issues(repo_full_name: str) -> list[IssueInfo]:
-    """Fetch open issues for a repository (excludes PRs)."""
-    output = run_gh_command([
-        "issue", "list",
-        "--repo", repo_full_name,
-        "--state", "open",
-        "--json", "number,title,author,createdAt,updatedAt,url,state,labels,assignees,comments"
-    ])
-
-    if not output:
-        return []
+def parse_ci_rollup(pr: dict) -> str:
+    """Map a PR's head commit statusCheckRollup to a CI status string."""
+    commits = (pr.get("commits") or {}).get("nodes") or []
+    if not commits:
+        return ""
+    rollup = commits[0]["commit"].get("statusCheckRollup") or {}
+    return CI_ROLLUP_STATES.get(rollup.get("state"), "")
+
+
+def parse_pr_node(pr: dict, inline_ci: bool) -> PRInfo:
+    """Build a PRInfo from a PRFields node."""
+    (number, title, head_branch, base_branch, created_at, updated_at,
+     url, state, is_draft, mergeable, head_sha, base_sha) = get_pr_fields(pr)
+    # Authors and labels repeat across PRs; intern them so each is stored once
+    labels = [sys.intern(l["name"]) for l in pr["labels"]["nodes"]]
+    return PRInfo(
+        number=number,
+        title=title,
+        head_branch=head_branch,
+        base_branch=base_branch,
+        author=sys.intern((pr["author"] or {}).get("login", "unknown")),
+        created_at=created_at,
+        updated_at=updated_at,
+        html_url=url,
+        ci_status=parse_ci_rollup(pr) if inline_ci else "",
+        head_sha=head_sha,
+        base_sha=base_sha,
+        state=state,
+        labels=labels,
+        draft=is_draft,
+        mergeable=mergeable != "CONFLICTING",
+    )
 
-    try:
-        issues_data = json.loads(output)
-        issues = []
-        for issue in issues_data:
-            labels = [l.get("name", "") for l in issue.get("labels", [])]
-            assignees = [a.get("login", "") for a in issue.get("assignees", [])]
-            issues.append(IssueInfo(
-                number=issue["number"],
-                title=issue["title"],
-                author=issue.get("author", {}).get("login", "unknown"),
-                created_at=issue.get("createdAt", ""),
-                updated_at=issue.get("updatedAt", ""),
-                html_url=issue.get("url", ""),
-                state=issue.get("state", "open"),
-                labels=labels,
-                assignees=assignees,
-                comments=issue.get("comments", 0),
-            ))
-        return issues
-    except json.JSONDecodeError:
-        return []
 
+def parse_issue_node(issue: dict) -> IssueInfo:
+    """Build an IssueInfo from an IssueFields node."""
+    number, title, author, created_at, updated_at, url, state = get_issue_fields(issue)
+    return IssueInfo(
+        number=number,
+        title=title,
+        author=sys.intern((author or {}).get("login", "unknown")),
+        created_at=created_at,
+        updated_at=updated_at,
+        html_url=url,
+        state=state,
+        labels=[sys.intern(l["name"]) for l in issue["labels"]["nodes"]],
+        assignees=[sys.intern(a["login"]) for a in issue["assignees"]["nodes"]],
+        comments=issue["comments"]["totalCount"],
+    )
 
-def get_pr_ci_status(repo_full_name: str, pr_number: int) -> str:
-    """Get CI status for a PR."""
-    output = run_gh_command([
-        "pr", "checks", str(pr_number),
-        "--repo", repo_full_name,
-        "--json", "bucket"
-    ])
 
-    if not output:
-        return ""
+async def get_ci_statuses(client: GitHubClient, repo_full_name: str, pr_numbers: list[int]) -> dict[int, str]:
+    """Fetch CI status for specific PRs of a repository in a single aliased GraphQL query."""
+    owner, name = repo_full_name.split("/", 1)
+    fields = "\n".join(
+        f"pr{number}: pullRequest(number: {number}) "
+        "{ commits(last: 1) { nodes { commit { statusCheckRollup { state } } } } }"
+        for number in pr_numbers
+    )
+    query = f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
 
-    try:
-        checks = json.loads(output)
-        if not checks:
-            return ""
-
-        has_fail = any(c.get("bucket") == "fail" for c in checks)
-        has_pending = any(c.get("bucket") == "pending" for c in checks)
-        has_pass = any(c.get("bucket") == "pass" for c in checks)
-
-        if has_fail:
-            return "fail"
-        elif has_pending:
-            return "pending"
-        elif has_pass:
-            return "pass"
-        return ""
-    except json.JSONDecodeError:
-        return ""
+    data = await client.graphql(query, {"owner": owner, "name": name})
+    repository = (data or {}).get("repository") or {}
+    return {
+        number: parse_ci_rollup(repository.get(f"pr{number}") or {})
+        for number in pr_numbers
+    }
+
+
+async def resolve_ci_statuses(
+    client: GitHubClient,
+    cache: ApiCache,
+    repo_full_name: str,
+    prs: list[PRInfo],
+    cached_ci: dict[str, str],
+    inline_ci: bool,
+    now: int,
+) -> None:
+    """Fill in CI status a per-repo PR query didn't carry, and record fresh results.
+
+    When the query ran without inline CI, cached statuses are reused and only
+    PRs whose head moved are queried, in one batch. The org-wide search always
+    carries CI inline and doesn't come through here.
+    """
+    if inline_ci:
+        fetched = prs
+    else:
+        fetched = [pr for pr in prs if pr.head_sha not in cached_ci]
+        for pr in prs:
+            pr.ci_status = cached_ci.get(pr.head_sha, "")
+        if fetched:
+            statuses = await get_ci_statuses(client, repo_full_name, [pr.number for pr in fetched])
+            for pr in fetched:
+                pr.ci_status = statuses[pr.number]
+
+    cache.put_ci_statuses(repo_full_name, {pr.head_sha: pr.ci_status for pr in fetched}, now)
+
+
+async def get_repo_prs_with_ci(
+    client: GitHubClient,
+    cache: ApiCache,
+    repo_full_name: str,
+    config: dict,
+    now: int,
+) -> list[PRInfo]:
+    """Fetch open PRs for a repository with CI status.
+
+    CI results are cached per head commit. A repo with no fresh cache entries
+    gets its CI status inline with the PR query.
+    """
+    owner, name = repo_full_name.split("/", 1)
+    fetch_ci = config.get("fetch_ci", True)
+    cached_ci = cache.get_ci_statuses(repo_full_name, config, now) if fetch_ci else {}
+    inline_ci = fetch_ci and not cached_ci
+    prs = []
+    cursor = None
+
+    while True:
+        data = await client.graphql(REPO_PRS_QUERY, {
+            "owner": owner,
+            "name": name,
+            "ci": inline_ci,
+            "endCursor": cursor,
+        })
+        repository = (data or {}).get("repository")
+        if not repository:
+            break
+
+        page = repository["pullRequests"]
+        prs.extend(parse_pr_node(pr, inline_ci) for pr in page["nodes"])
+
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        cursor = page["pageInfo"]["endCursor"]
+
+    if fetch_ci:
+        await resolve_ci_statuses(client, cache, repo_full_name, prs, cached_ci, inline_ci, now)
+    return prs
+
+
+async def get_repo_issues(client: GitHubClient, repo_full_name: str) -> list[IssueInfo]:
+    """Fetch open issues for a repository (excludes PRs)."""
+    issues_data = await client.get_paginated(
+        f"/repos/{repo_full_name}/issues?state=open&per_page=100"
+    )
+
+    if not issues_data:
+        return []
+
+    issues = []
+    for issue in issues_data:
+        # The issues endpoint also lists PRs; those are tracked separately
+        if "pull_request" in issue:
+            continue
+        labels = [sys.intern(l.get("name", "")) for l in issue.get("labels", [])]
+        assignees = [sys.intern(a.get("login", "")) for a in issue.get("assignees", [])]
+        issues.append(IssueInfo(
+            number=issue["number"],
+            title=issue["title"],
+            author=sys.intern((issue.get("user") or {}).get("login", "unknown")),
+            created_at=issue.get("created_at", ""),
+            updated_at=issue.get("updated_at", ""),
+            html_url=issue.get("html_url", ""),
+            state=issue.get("state", "open"),
+            labels=labels,
+            assignees=assignees,
+            comments=issue.get("comments", 0),
+        ))
+    return issues
+
+
+async def search_org(client: GitHubClient, query: str, ci: bool) -> Optional[list[dict]]:
+    """Run a paginated org-wide search and return every node.
+
+    Returns None if the search failed or matched more results than GitHub
+    search will return, so the caller can fall back to per-repo queries.
+    """
+    nodes = []
+    cursor = None
+
+    while True:
+        data = await client.graphql(ORG_SEARCH_QUERY, {
+            "q": query,
+            "ci": ci,
+            "endCursor": cursor,
+        })
+        search = (data or {}).get("search")
+        if not search:
+            print(f"Org-wide search '{query}' failed", file=sys.stderr)
+            return None
+        if search["issueCount"] > SEARCH_RESULT_LIMIT:
+            print(f"Org-wide search '{query}' matched {search['issueCount']} results, "
+                  f"more than the {SEARCH_RESULT_LIMIT} it can return", file=sys.stderr)
+            return None
 
+        nodes.extend(search["nodes"])
+
+        if not search["pageInfo"]["hasNextPage"]:
+            return nodes
+        cursor = search["pageInfo"]["endCursor"]
+
+
+async def get_org_prs_and_issues(
+    client: GitHubClient,
+    cache: ApiCache,
+    org: str,
+    repos: list[RepoInfo],
+    config: dict,
+    now: int,
+    on_prs: Callable[[RepoInfo, list[PRInfo]], Awaitable[None]],
+) -> tuple[dict[str, list[PRInfo]], dict[str, list[IssueInfo]]]:
+    """Fetch open PRs (with CI status) and issues for all repos, keyed by repo full name.
+
+    PRs and issues each come from one paginated search for the whole org, so
+    repos without open PRs or issues cost nothing. If a search fails or the
+    org has more open items of that kind than search can return, only that
+    kind is queried per repo instead.
+    The PR search always carries CI status inline, since the rollup costs no
+    extra request there; the CI cache only spares the per-repo fallback.
+    on_prs is awaited for every repo with open PRs as soon as its PRs are
+    final, so it overlaps the remaining issue and fallback requests.
+    """
+    fetch_prs = config.get("fetch_prs", True)
+    fetch_issues = config.get("fetch_issues", True)
+    fetch_ci = fetch_prs and config.get("fetch_ci", True)
+    prs_by_repo: dict[str, list[PRInfo]] = {repo.full_name: [] for repo in repos}
+    issues_by_repo: dict[str, list[IssueInfo]] = {repo.full_name: [] for repo in repos}
 
-def get_commits_between_branches(
+    async def fetch_repo_prs(repo: RepoInfo) -> None:
+        prs = await get_repo_prs_with_ci(client, cache, repo.full_name, config, now)
+        prs_by_repo[repo.full_name] = prs
+        if prs:
+            await on_prs(repo, prs)
+
+    async def get_prs() -> None:
+        nodes = await search_org(client, f"org:{org} is:open is:pr", fetch_ci)
+        if nodes is None:
+            print("Fetching open PRs per repository")
+            await asyncio.gather(*[fetch_repo_prs(repo) for repo in repos])
+            return
+
+        for item in nodes:
+            # Search covers every repo in the org; keep only the tracked ones
+            prs = prs_by_repo.get(item["repository"]["nameWithOwner"])
+            if prs is not None:
+                prs.append(parse_pr_node(item, fetch_ci))
+
+        tracked = [(repo, prs_by_repo[repo.full_name]) for repo in repos if prs_by_repo[repo.full_name]]
+        if fetch_ci:
+            # Keep the cache current for runs that fall back to per-repo queries
+            for repo, prs in tracked:
+                cache.put_ci_statuses(repo.full_name, {pr.head_sha: pr.ci_status for pr in prs}, now)
+        await asyncio.gather(*[on_prs(repo, prs) for repo, prs in tracked])
+
+    async def fetch_repo_issues(repo: RepoInfo) -> None:
+        issues_by_repo[repo.full_name] = await get_repo_issues(client, repo.full_name)
+
+    async def get_issues() -> None:
+        nodes = await search_org(client, f"org:{org} is:open is:issue", False)
+        if nodes is None:
+            print("Fetching open issues per repository")
+            await asyncio.gather(*[fetch_repo_issues(repo) for repo in repos])
+            return
+
+        for item in nodes:
+            issues = issues_by_repo.get(item["repository"]["nameWithOwner"])
+            if issues is not None:
+                issues.append(parse_issue_node(item))
+
+    jobs = []
+    if fetch_prs:
+        jobs.append(get_prs())
+    if fetch_issues:
+        jobs.append(get_issues())
+    await asyncio.gather(*jobs)
+    return prs_by_repo, issues_by_repo
+
+
+async def get_commits_between_branches(
+    client: GitHubClient,
     repo_full_name: str,
     base_branch: str,
     head_branch: str,
     max_commits: int = 10
-) -> list[dict]:
-    """Get commits between two branches using GitHub API."""
-    # Include author avatar URL in the query
-    output = run_gh_command([
-        "api", f"repos/{repo_full_name}/compare/{base_branch}...{head_branch}",
-        "--jq", '.commits[:10] | .[] | {sha: .sha, message: .commit.message, author: .commit.author.name, date: .commit.author.date, html_url: .html_url, author_login: .author.login, author_avatar_url: .author.avatar_url}'
-    ])
-
-    if not output:
-        return []
+) -> Optional[list[dict]]:
+    """Get commits between two branches using GitHub API (None if the compare failed)."""
+    # Results are kept in the compare cache by SHA pair, so the full response
+    # (with per-file patches) isn't worth storing in the HTTP cache as well
+    compare = await client.get_json(
+        f"/repos/{repo_full_name}/compare/{quote(base_branch)}...{quote(head_branch)}",
+        use_cache=False,
+    )
 
-    commits = []
-    for line in output.strip().split('\n'):
-        if not line:
-            continue
-        try:
-            data = json.loads(line)
-            commits.append({
-                "sha": data["sha"],
-                "short_sha": data["sha"][:7],
-                "message": data["message"].split('\n')[0][:80],
-                "author": data["author"],
-                "author_login": data.get("author_login", ""),
-                "author_avatar_url": data.get("author_avatar_url", ""),
-                "date": data["date"][:10],
-                "html_url": data["html_url"],
-            })
-        except json.JSONDecodeError:
-            continue
+    if not compare:
+        return None
 
-    return commits[:max_commits]
+    raw_commits = compare.get("commits", [])[:max_commits]
+    commits: list = [None] * len(raw_commits)
+    for i, data in enumerate(raw_commits):
+        # Include author avatar URL from the linked GitHub account
+        author = data.get("author") or {}
+        commits[i] = {
+            "sha": data["sha"],
+            "short_sha": data["sha"][:7],
+            "message": data["commit"]["message"].split('\n')[0][:80],
+            "author": sys.intern(data["commit"]["author"]["name"]),
+            "author_login": sys.intern(author.get("login", "")),
+            "author_avatar_url": sys.intern(author.get("avatar_url", "")),
+            "date": data["commit"]["author"]["date"][:10],
+            "html_url": data["html_url"],
+        }
+
+    return commits
 
 
 # ============================================================================
 # Hierarchy Building
 # ============================================================================
 
-def build_repo_tree(
-    repo: RepoInfo,
-    prs: list[PRInfo],
-    fetch_commits: bool = True
-) -> dict:
+def build_repo_tree(repo: RepoInfo, prs: list[PRInfo]) -> TreeNode:
     """Build a tree structure for a repository's PRs."""
 
     # PR lookup: head_branch -> PR info
@@ -395,7 +982,7 @@ def build_repo_tree(
         branch=repo.default_branch,
         repo_name=repo.name,
         github_url=repo.html_url,
-        last_updated=repo.pushed_at,
+        last_updated=format_gh_timestamp(repo.pushed_at),
     )
 
     nodes: dict[str, TreeNode] = {}
@@ -418,17 +1005,20 @@ def build_repo_tree(
         )
         nodes[pr.head_branch] = node
 
-    # Add intermediate PR branches (PRs that target other PRs)
+    # Add intermediate PR branches (PRs that target other PRs). Each branch's
+    # parent chain is walked once; later walks stop at an already resolved branch.
     branches_to_add = set()
-    for branch in list(nodes.keys()):
+    resolved = set()
+    for branch in nodes:
         current = branch
         visited = set()
-        while current in pr_lookup and current not in visited:
+        while current in pr_lookup and current not in resolved and current not in visited:
             visited.add(current)
             parent_branch = pr_lookup[current].base_branch
             if parent_branch not in nodes and parent_branch != repo.default_branch:
                 branches_to_add.add(parent_branch)
             current = parent_branch
+        resolved |= visited
 
     for branch in branches_to_add:
         pr = pr_lookup.get(branch)
@@ -445,140 +1035,165 @@ def build_repo_tree(
             )
             nodes[branch] = node
 
-    # Build parent-child relationships
-    attached = set()
+    # Resolve parent-child relationships; None stands for the root node
+    parents: dict[str, Optional[str]] = {}
     for branch, node in nodes.items():
         pr = pr_lookup.get(branch)
-        if pr:
-            parent_branch = pr.base_branch
-            if parent_branch in nodes:
-                nodes[parent_branch].children.append(node)
-                attached.add(branch)
-                node.parent_branch_name = parent_branch
-            elif parent_branch == repo.default_branch:
-                node.parent_branch_name = repo.default_branch
-
-    # Attach unattached nodes to root
+        parent_branch = pr.base_branch if pr else None
+        if parent_branch in nodes:
+            parents[branch] = parent_branch
+            node.parent_branch_name = parent_branch
+        else:
+            # Attach unattached nodes to root
+            parents[branch] = None
+            node.parent_branch_name = repo.default_branch
+
+    # Size every children list up front, then fill it in order
+    child_count = Counter(parents.values())
+    root.children = [None] * child_count[None]
     for branch, node in nodes.items():
-        if branch not in attached:
-            root.children.append(node)
-            if not node.parent_branch_name:
-                node.parent_branch_name = repo.default_branch
-
-    # Fetch commits for branches (optional, can be slow)
-    if fetch_commits:
-        for branch, node in nodes.items():
-            if node.parent_branch_name:
-                try:
-                    commits = get_commits_between_branches(
-                        repo.full_name,
-                        node.parent_branch_name,
-                        branch,
-                        max_commits=5
-                    )
-                    node.commits_from_parent = commits
-                except Exception:
-                    pass  # Skip commits on error
+        node.children = [None] * child_count[branch]
 
-    return tree_node_to_dict(root)
+    child_idx: defaultdict[Optional[str], int] = defaultdict(int)
+    for branch, parent_branch in parents.items():
+        parent = root if parent_branch is None else nodes[parent_branch]
+        parent.children[child_idx[parent_branch]] = nodes[branch]
+        child_idx[parent_branch] += 1
 
+    return root
 
-def tree_node_to_dict(node: TreeNode) -> dict:
-    """Convert TreeNode to serializable dict."""
-    return {
-        "name": node.name,
-        "branch": node.branch,
-        "repo_name": node.repo_name,
-        "pr_number": node.pr_number,
-        "pr_title": node.pr_title,
-        "pr_url": node.pr_url,
-        "pr_author": node.pr_author,
-        "last_updated": node.last_updated,
-        "ci_status": node.ci_status,
-        "github_url": node.github_url,
-        "is_draft": node.is_draft,
-        "labels": node.labels,
-        "commits_from_parent": node.commits_from_parent,
-        "parent_branch_name": node.parent_branch_name,
-        "children": [tree_node_to_dict(child) for child in node.children],
-    }
+
+async def fetch_tree_commits(
+    client: GitHubClient,
+    cache: ApiCache,
+    repo: RepoInfo,
+    prs: list[PRInfo],
+    root: TreeNode,
+    now: int,
+) -> None:
+    """Fill in commits_from_parent for every PR node of a repo's tree.
+
+    Compare calls are issued together, bounded only by the client's
+    connection limit.
+    """
+    # Known branch tips, so unchanged base...head pairs can be served from cache
+    branch_shas = {pr.base_branch: pr.base_sha for pr in prs}
+    branch_shas.update({pr.head_branch: pr.head_sha for pr in prs})
+
+    async def fetch_node_commits(node: TreeNode) -> None:
+        base_sha = branch_shas.get(node.parent_branch_name)
+        head_sha = branch_shas.get(node.branch)
+        if base_sha and head_sha:
+            cached = cache.get_commits(repo.full_name, base_sha, head_sha, now)
+            if cached is not None:
+                node.commits_from_parent = cached
+                return
+        try:
+            commits = await get_commits_between_branches(
+                client,
+                repo.full_name,
+                node.parent_branch_name,
+                node.branch,
+                max_commits=5
+            )
+        except Exception:
+            return  # Skip commits on error
+        if commits is None:
+            return
+        node.commits_from_parent = commits
+        if base_sha and head_sha:
+            cache.put_commits(repo.full_name, base_sha, head_sha, commits, now)
+
+    jobs = []
+    stack = list(root.children)
+    while stack:
+        node = stack.pop()
+        stack.extend(node.children)
+        if node.parent_branch_name:
+            jobs.append(fetch_node_commits(node))
+
+    await asyncio.gather(*jobs)
 
 
 # ============================================================================
 # Main Data Fetching
 # ============================================================================
 
-def fetch_org_data(config: dict) -> dict:
+async def fetch_org_data(config: dict, cache_path: Path = CACHE_FILE) -> dict:
     """Fetch all data for an organization."""
     org = config["organization"]
-    fetch_prs = config.get("fetch_prs", True)
-    fetch_ci = config.get("fetch_ci", True)
-    fetch_issues = config.get("fetch_issues", True)
+    fetch_commits = config.get("fetch_commits", True)
+
+    # One "now" for the whole run: repo cutoff, cache ages and generated_at
+    run_start = utc_now()
+    now = int(run_start.timestamp())
 
-    start_time = time.time()
+    token = get_auth_token()
+    if not token:
+        return {"error": "Could not read a GitHub token from GH_TOKEN, GITHUB_TOKEN or `gh auth token`"}
 
-    # Get all repos
-    repos = get_org_repos(org, config)
-    if not repos:
-        return {"error": f"No repositories found for {org}"}
+    cache = ApiCache(cache_path)
+    client = GitHubClient(token, cache, now, max_connections=config.get("max_concurrency", 8))
+    cache.prune(max(get_ci_cache_duration(s, config) for s in ("pass", "pending")), now)
 
-    trees = {}
+    try:
+        # Get all repos
+        repos = await get_org_repos(client, org, config, run_start)
+        if not repos:
+            return {"error": f"No repositories found for {org}"}
+
+        built_trees: dict[str, TreeNode] = {}
+
+        async def process_repo(repo: RepoInfo, prs: list[PRInfo]) -> None:
+            # Build the tree and start its compare calls as soon as this repo's
+            # PRs are final, while other repos are still being fetched
+            tree = build_repo_tree(repo, prs)
+            built_trees[repo.full_name] = tree
+
+            # Fetch commits for branches (optional, can be slow)
+            if fetch_commits:
+                await fetch_tree_commits(client, cache, repo, prs, tree, now)
+
+        # Get PRs (with CI status) and issues for every repo at once
+        prs_by_repo, repo_issues = await get_org_prs_and_issues(client, cache, org, repos, config, now, process_repo)
+        print(f"Built PR trees for {len(built_trees)} repositories")
+    finally:
+        client.close()
+        cache.close()
+
+    trees = {repo.name: built_trees[repo.full_name] for repo in repos if repo.full_name in built_trees}
     issues_by_repo = {}
-    total_prs = 0
+    total_prs = sum(len(prs) for prs in prs_by_repo.values())
     total_issues = 0
 
-    for i, repo in enumerate(repos):
-        print(f"[{i+1}/{len(repos)}] Processing {repo.name}...")
-
-        # Get PRs for this repo
-        if fetch_prs:
-            prs = get_repo_prs(repo.full_name)
-
-            # Get CI status for each PR
-            if fetch_ci and prs:
-                for pr in prs:
-                    pr.ci_status = get_pr_ci_status(repo.full_name, pr.number)
-                    time.sleep(0.1)  # Small delay to avoid rate limits
-
-            total_prs += len(prs)
-        else:
-            prs = []
-
-        # Get issues for this repo
-        if fetch_issues:
-            issues = get_repo_issues(repo.full_name)
-            if issues:
-                issues_by_repo[repo.name] = {
-                    "repo_name": repo.name,
-                    "github_url": repo.html_url,
-                    "issues": [
-                        {
-                            "number": issue.number,
-                            "title": issue.title,
-                            "author": issue.author,
-                            "created_at": issue.created_at,
-                            "updated_at": issue.updated_at,
-                            "html_url": issue.html_url,
-                            "labels": issue.labels,
-                            "assignees": issue.assignees,
-                            "comments": issue.comments,
-                        }
-                        for issue in issues
-                    ]
-                }
-                total_issues += len(issues)
-
-        # Build tree for this repo (only if it has PRs)
-        if prs:
-            fetch_commits = config.get("fetch_commits", True)
-            tree = build_repo_tree(repo, prs, fetch_commits=fetch_commits)
-            trees[repo.name] = tree
-
-    elapsed = time.time() - start_time
+    for repo in repos:
+        issues = repo_issues[repo.full_name]
+        if issues:
+            issues_by_repo[repo.name] = {
+                "repo_name": repo.name,
+                "github_url": repo.html_url,
+                "issues": [
+                    {
+                        "number": issue.number,
+                        "title": issue.title,
+                        "author": issue.author,
+                        "created_at": issue.created_at,
+                        "updated_at": issue.updated_at,
+                        "html_url": issue.html_url,
+                        "labels": issue.labels,
+                        "assignees": issue.assignees,
+                        "comments": issue.comments,
+                    }
+                    for issue in issues
+                ]
+            }
+            total_issues += len(issues)
+
+    elapsed = (utc_now() - run_start).total_seconds()
 
     result = {
         "organization": org,
-        "generated_at": utc_now().isoformat(),
+        "generated_at": run_start.isoformat(),
         "generation_time_seconds": round(elapsed, 2),
         "stats": {
             "total_repos": len(repos),
@@ -621,6 +1236,9 @@ def main():
 
     args = parser.parse_args()
 
+    # gh is only launched for the token lookup; skip its update check
+    os.environ["GH_NO_UPDATE_NOTIFIER"] = "1"
+
     # Load config
     config = load_config()
 
@@ -640,11 +1258,10 @@ def main():
     print(f"Organization: {config['organization']}")
     print()
 
-    data = fetch_org_data(config)
+    data = asyncio.run(fetch_org_data(config, cache_path=output_path.parent / CACHE_FILE.name))
 
     # Write output
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json(output_path, data)
 
     print(f"\nData written to: {output_path}")
 